@@ -53,19 +53,20 @@ class StreamDecoder(Iterator):
         self._current = None  # 当前正在处理的节点
         self._observers = []  # 事件监听者
 
-        if isinstance(data, bytes):
-            self._istream = BytesIO(data)
-            self._buffer = data
-        elif isinstance(data, bytearray):
-            self._istream = BytesIO(data)
-            self._buffer = data
+        if isinstance(data, bytes) or isinstance(data, bytearray):  # 字节串按偏移值直接解析，无需包装为流
+            self._istream = None
+            self._buffer = bytes(data)  # bytes原样使用；bytearray复制一次，不锁定调用方的缓冲区，与原先BytesIO的语义一致
+            self._pos = 0
         else:
             self._istream = data
             self._buffer = None
+            self._pos = data.tell()  # 当前读取位置的偏移值
 
 
     def reset(self):
-        self._istream.seek(0)
+        if self._istream is not None:
+            self._istream.seek(0)
+        self._pos = 0
         self._stack = []
         self._current = None
         self._observers = []
@@ -93,22 +94,22 @@ class StreamDecoder(Iterator):
     def proceed_token(self) -> Optional[Token]:
         """处理遇到的下一个元素
         """
-        tof = self._istream.tell()  # 标签Tag域的偏移值
-        tag = Tag.decode(self._istream)  # 读取标签
+        tof = self._pos  # 标签Tag域的偏移值
+        tag = self._read_tag()  # 读取标签
         if tag is None:  # 遇到字节流结尾，读取结束
             if self._stack:  # 如果此时栈不为空，则说明父元素未读取结束
                 raise InvalidEncoding(f"数据截断导致父元素不完整/Incomplete parent item due to data truncation: "
                                       f"{self._stack[-1]}")
             return None
 
-        lof = self._istream.tell()  # 长度Length域的偏移值
-        length = Length.decode(self._istream)  # 读取长度
+        lof = self._pos  # 长度Length域的偏移值
+        length = self._read_length()  # 读取长度
         if length is None:  # 标签后无长度，说明编码错误或者数据不完整
             raise InvalidEncoding(f'标签后无长度，编码错误或者数据不完整'
                                   f'/Missing length due to invalid encoding or data truncation: '
                                   f'{self._stack[-1]} > {tag}')
 
-        vof = self._istream.tell()  # 数值Value域的偏移值
+        vof = self._pos  # 数值Value域的偏移值
         self._current = Token(tag, length, TokenOffsets(tof, lof, vof), None, None, None)  # 当前标签读出
         if self._stack:  # 当前层级非顶级，将当前Token加入上级Constructed
             self._current.parent = self._stack[-1]
@@ -127,13 +128,42 @@ class StreamDecoder(Iterator):
             self._begin_proceed_constructed()  # 处理组合类型元素
             return self._current
 
+    def _read_tag(self) -> Optional[Tag]:
+        """在当前位置读取标签，并将当前位置移至标签之后"""
+        if self._buffer is None:
+            tag = Tag.decode(self._istream)
+            if tag is not None:
+                self._pos += len(tag)
+        else:
+            tag, self._pos = Tag.decode_from(self._buffer, self._pos)
+        return tag
+
+    def _read_length(self) -> Optional[Length]:
+        """在当前位置读取长度，并将当前位置移至长度之后"""
+        if self._buffer is None:
+            length = Length.decode(self._istream)
+            if length is not None:
+                self._pos += len(length)
+        else:
+            length, self._pos = Length.decode_from(self._buffer, self._pos)
+        return length
+
+    def _read_value(self, size: int) -> bytes:
+        """在当前位置读取至多size个字节的数值，并将当前位置移至其后"""
+        if self._buffer is None:
+            value_octets = self._istream.read(size)
+        else:
+            value_octets = self._buffer[self._pos:self._pos + size]
+        self._pos += len(value_octets)
+        return value_octets
+
     def _proceed_primitive(self):
         """处理基本类型元素"""
         if not self._current.length.is_definite:  # 基本类型元素必须为定长
             raise InvalidEncoding(f"基本类型元素长度为不定长/Primitive tag with indefinite length: {self._current}")
 
         the_length = self._current.length.value
-        value_octets = self._istream.read(the_length)  # 读取数值Value域
+        value_octets = self._read_value(the_length)  # 读取数值Value域
         if len(value_octets) < the_length:  # 剩余字节不足
             raise InvalidEncoding(f"数据域长度不足/Incomplete value field: {self._current}")
         # if self._buffer:
@@ -157,7 +187,7 @@ class StreamDecoder(Iterator):
             if parent.length.is_definite:  # 父元素定长
                 expected_pos = parent.offsets.v + parent.length.value
                 # 根据父元素长度Length域值和Value域偏移值计算父元素结束偏移值
-                current_pos = self._istream.tell()  # 当前元素结束时的偏移值
+                current_pos = self._pos  # 当前元素结束时的偏移值
                 if expected_pos == current_pos:  # 相等则父元素也结束，退栈
                     self._current = self._stack.pop()  # 当前元素设置为父元素
                     self._on_token_end()  # 触发父元素结束事件
@@ -171,7 +201,7 @@ class StreamDecoder(Iterator):
             else:  # 父元素为不定长元素
                 # 如果当前是EOC标记，则父元素结束
                 if self._current.tag.octets == b'\x00':
-                    if self._current.length != 0:
+                    if self._current.length.value != 0:
                         raise InvalidEncoding('内容结束EOC元素的长度不为0/Length of End-of-content is not 0')
                     self._current = self._stack.pop()  # 退栈并将父元素设置为当前元素
                     self._on_token_end()  # 触发父元素结束事件
@@ -180,13 +210,13 @@ class StreamDecoder(Iterator):
 
     def _on_token_begin(self):
         """触发元素开始事件"""
-        logger.debug(f'->{"  " * len(self._stack)} {self._current}')
+        logger.debug('->%s %s', '  ' * len(self._stack), self._current)
         for obs in self._observers:
             obs.on_event(DecodingListener.BEGIN_EVENT, self._current, self._stack)
 
     def _on_token_end(self):
         """触发元素结束事件"""
-        logger.debug(f'<-{"  " * len(self._stack)} {self._current}')
+        logger.debug('<-%s %s', '  ' * len(self._stack), self._current)
         for obs in self._observers:
             obs.on_event(DecodingListener.END_EVENT, self._current, self._stack)
 
@@ -1,4 +1,5 @@
 from ..data_types import *
+from ..data_types.real import floats_to_binary_encodings
 from contextlib import contextmanager
 
 logger = logging.getLogger()
@@ -87,6 +88,11 @@ class StreamEncoder:
         item = ASN1Real(value, base=base)
         return self.append_primitive(item.tag, item.value_octets)
 
+    def append_reals(self, values: Sequence[float], base: int = 2) -> None:
+        """批量编码双精度浮点数并依次写入缓冲区，各浮点数的比特模式一次性读出"""
+        for value_octets in floats_to_binary_encodings(values, base):
+            self.append_primitive(TAG_Real, value_octets)
+
     def append_bit_string(self, value: bytes, bit_length=None, unused_bit=None) -> None:
         if bit_length is None:
             if unused_bit is None:
@@ -10,6 +10,8 @@ logger = logging.getLogger(__name__)
 class ASN1DataType:
     """表示各种数据格式的基类
     """
+    __slots__ = ('_der', '_length', '_value', '_value_octets')
+
     def __init__(self, value=None, length: Length = None, value_octets: bytes = None, der: bool = False):
         """通过标签（Tag）、长度（Length）、数值（Value）构建成的ASN.1数据对象
 
@@ -20,7 +22,7 @@ class ASN1DataType:
 
         构建过程中将检查参数一致性。
         """
-        logger.debug(f'{self.__class__} {length} {value} {value_octets}')
+        logger.debug('%s %s %s %s', self.__class__, length, value, value_octets)  # 惰性格式化，未开启DEBUG时不生成字符串
         self._der = der
 
         if length and not length.is_definite:
@@ -181,7 +183,8 @@ EXTENDED_DATA_TYPE_MAP = {}
 def asn1_decode(data: Union[bytes, bytearray, BinaryIO], der: bool = False, callback=None) -> List[ASN1DataType]:
     res = []
     for t, l, v in iter_tlvs(data, return_octets=False):
-        logger.debug('TLV: %s %s %s', t, l, v.hex())
+        if logger.isEnabledFor(logging.DEBUG):  # v.hex()需要分配新字符串，仅在开启DEBUG时生成
+            logger.debug('TLV: %s %s %s', t, l, v.hex())
         if t.octets in UNIVERSAL_DATA_TYPE_MAP:
             item = UNIVERSAL_DATA_TYPE_MAP[t.octets](length=l, value_octets=v, der=der)
         elif t.octets in EXTENDED_DATA_TYPE_MAP:
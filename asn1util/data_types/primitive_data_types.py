@@ -1,10 +1,10 @@
 import re
-import struct
+from types import MappingProxyType
 from decimal import Decimal
 from datetime import datetime, timedelta, timezone
 from .general_data_types import *
-from asn1util.data_types.real import (SpecialRealValue, to_decimal_encoding, to_binary_encoding,
-                                      int_to_base2_sne, ieee754_double_to_base2_sne, decimal_to_base2_sne,
+from asn1util.data_types.real import (SpecialRealValue, to_decimal_encoding, to_binary_encoding, from_binary_encoding,
+                                      int_to_base2_sne, float_to_base2_sne, decimal_to_base2_sne,
                                       to_ieee758_double)
 from asn1util.exceptions import InvalidEncoding, DERIncompatible, UnsupportedValue
 from asn1util.tlv import Tag, Length
@@ -51,9 +51,10 @@ class ASN1EndOfContent(ASN1DataType):
 
     """X.690 8.1.5 EOC"""
     def __init__(self, value: bytes = None, length: Length = None, value_octets: bytes = b'', der: bool = False):
-        assert length is None or length.value == 0
-        assert value is None or len(value) == 0
-        assert value_octets is None or len(value_octets) == 0
+        if (length is not None and length.value != 0) or value_octets:
+            raise InvalidEncoding("EOC的长度必须为0")
+        if value:
+            raise ValueError("EOC不能有值")
         super().__init__(value, length, value_octets, der)
         if der:
             raise DERIncompatible('DER编码中不出现不确定长度和EOC数据对象')
@@ -146,6 +147,14 @@ class ASN1Enumerated(ASN1Integer):
         return 'Enumerated'
 
 
+# 实数Real类型二进制编码时，各数值类型到以2为底的S,N,E分解函数的映射
+_REAL_BASE2_SNE_CONVERTERS = MappingProxyType({
+    int: int_to_base2_sne,
+    float: float_to_base2_sne,
+    Decimal: decimal_to_base2_sne,
+})
+
+
 class ASN1Real(ASN1DataType):
     """X.690 8.4 Real"""
     def __init__(self, value=None, length: Length = None, value_octets: bytes = None, der: bool = False,
@@ -168,6 +177,8 @@ class ASN1Real(ASN1DataType):
         return 'Real'
 
     def decode_value(self, octets: bytes, der: bool) -> Union[float, Decimal, SpecialRealValue]:
+        if not octets:  # X.690 8.5.2 零值没有内容字节
+            return 0.0
         leading = octets[0]
         if (b8b7 := leading & 0xc0) == 0x00:  # b8b7=0，十进制表示
             # X.690 8.5.8 (P8)
@@ -180,37 +191,11 @@ class ASN1Real(ASN1DataType):
             return Decimal(octets[1:].decode('ascii'))  # TODO:BER/DER编码检查
         elif b8b7 == 0x40:  # 特殊实数 Special Real Values
             if leading & 0x3f < 0x04:
-                return SpecialRealValue(leading)
+                return SpecialRealValue.eval(leading)
             else:
                 raise InvalidEncoding("特殊实数保留值{}".format(hex(leading)))
         else:  # b8=1，二进制表示
-            s: int = 1 if leading & 0x40 == 0 else -1
-            f: int = (leading & 0x0c) >> 2
-
-            if (b2b1 := leading & 0x03) == 0x00:
-                e: int = int.from_bytes(octets[1:2], byteorder='big', signed=True)
-                n: int = int.from_bytes(octets[2:], byteorder='big')
-            elif b2b1 == 0x01:
-                e: int = int.from_bytes(octets[1:3], byteorder='big', signed=True)
-                n: int = int.from_bytes(octets[3:], byteorder='big')
-            elif b2b1 == 0x02:
-                e: int = int.from_bytes(octets[1:4], byteorder='big', signed=True)
-                n: int = int.from_bytes(octets[4:], byteorder='big')
-            else:
-                el = int.from_bytes(octets[1:2], byteorder='big', signed=False)
-                e: int = int.from_bytes(octets[2:el + 2], byteorder='big', signed=True)
-                n: int = int.from_bytes(octets[el + 2:], byteorder='big')
-
-            if (b6b5 := leading & 0x30) == 0x00:
-                base = 2
-            elif b6b5 == 0x10:
-                base = 8
-                e = e * 3 + f
-            elif b6b5 == 0x20:
-                base = 16
-                e = e * 4 + f
-            else:
-                raise InvalidEncoding("二进制底数保留值{}".format(hex(leading)))
+            s, n, e, base = from_binary_encoding(octets)
             if self._base:
                 if base != self._base:
                     raise InvalidEncoding("二进制底数不一致{} != {:d}".format(hex(leading), self._base))
@@ -222,25 +207,22 @@ class ASN1Real(ASN1DataType):
     def encode_value(self, value: Union[int, float, Decimal]) -> bytes:
         if srv := SpecialRealValue.check_special_value(value):
             return srv.octets
-
         if self._base is None:  # 默认采用不损失精度的幂底数
             self._base = 2 if isinstance(value, float) or isinstance(value, int) else 10
+        if value == 0:  # X.690 8.5.2 正零编码为空内容（负零已作为特殊实数处理）
+            return b''
         if self._base == 10:
             return to_decimal_encoding(value)
-        else:
-            if isinstance(value, int):
-                return to_binary_encoding(*int_to_base2_sne(value))
-            elif isinstance(value, float):
-                sne = ieee754_double_to_base2_sne(struct.pack('>d', value))
-                if isinstance(sne, SpecialRealValue):
-                    return bytes((sne, ))
-                else:
-                    return to_binary_encoding(*sne, base=self._base)
-            elif isinstance(value, Decimal):
-                sne = decimal_to_base2_sne(value)
-                return to_binary_encoding(*sne, base=self._base)
-            else:
+
+        # 按值的类型直接查表选择S,N,E分解函数，仅在int、float、Decimal的子类时才回溯MRO
+        value_type = type(value)
+        converter = _REAL_BASE2_SNE_CONVERTERS.get(value_type)
+        if converter is None:
+            converter = next((_REAL_BASE2_SNE_CONVERTERS[t] for t in value_type.__mro__
+                              if t in _REAL_BASE2_SNE_CONVERTERS), None)
+            if converter is None:
                 raise ValueError("数据{}类型不是int、float或Decimal".format(value))
+        return to_binary_encoding(*converter(value), base=self._base)
 
     def __repr__(self) -> str:
         return self._repr_common_format(meta_expr=f'(len={self._length.value},base={self._base})',
@@ -326,9 +308,10 @@ class ASN1OctetString(ASN1DataType):
 
 class ASN1Null(ASN1DataType):
     def __init__(self, value=None, length: Length = None, value_octets: bytes = None, der: bool = False):
-        assert length is None or length.value == 0
-        assert value is None or len(value) == 0
-        assert value_octets is None or len(value_octets) == 0
+        if (length is not None and length.value != 0) or value_octets:  # X.690 8.8.2
+            raise InvalidEncoding("Null的内容必须为空")
+        if value:
+            raise ValueError("Null不能有值")
         super().__init__(length=Length.eval(0), value_octets=b'')
 
     @property
@@ -353,6 +336,99 @@ class ASN1Null(ASN1DataType):
 ASN1_NULL = ASN1Null()
 
 
+# 字节到“是否为子id末字节（b8=0）”标记的转换表，用于bytes.translate一次性标出所有子id边界
+_OID_TERMINATOR_MARKS = bytes(0 if b & 0x80 else 1 for b in range(256))
+# 子id（位于开头或紧跟在末字节之后）以0x80开头，即未采用最少字节数编码，X.690 8.19.2
+_OID_PADDING_PATTERN = re.compile(rb'(?:^|[\x00-\x7f])\x80')
+
+
+def _decode_object_identifier(octets: bytes) -> Tuple[int, ...]:
+    """将OID数值字节串解码为各元素组成的元组，X.690 8.19"""
+    if _OID_PADDING_PATTERN.search(octets):  # 一次扫描校验所有子id，代替逐字节判断
+        raise InvalidEncoding("ObjectIdentifier中subidentifier的首字节不能为0x80", octets)
+    marks = octets.translate(_OID_TERMINATOR_MARKS)
+    components = []
+    pos, total = 0, len(octets)
+    while pos < total:
+        end = marks.find(1, pos)  # 在C层查找当前子id的末字节
+        if end < 0:
+            raise InvalidEncoding("ObjectIdentifier中末尾subidentifier未结束", octets)
+        if end == pos:  # 单字节子id最为常见
+            sn = octets[pos]
+        else:
+            sn = 0
+            for i in range(pos, end + 1):
+                sn = (sn << 7) | (octets[i] & 0x7f)
+        if components:
+            components.append(sn)
+        else:  # 首个subidentifier直接拆分为前两个元素，避免事后插入或切片
+            components.extend(divmod(sn, 40) if sn < 80 else (2, sn - 80))
+        pos = end + 1
+
+    if not components:
+        raise InvalidEncoding("ObjectIdentifier数值字节为空", octets)
+    return tuple(components)
+
+
+def _encode_object_identifier(oid: Sequence[int]) -> bytes:
+    """将已校验的OID元素序列编码为数值字节串，X.690 8.19"""
+    sub_ids = (oid[0] * 40 + oid[1], *oid[2:])
+    sizes = [(sn.bit_length() + 6) // 7 or 1 for sn in sub_ids]  # 每个子id所需的7比特组数
+    octets = bytearray(sum(sizes))  # 一次性分配，按正序填写，无需逐字节追加和反转
+    pos = 0
+    for sn, size in zip(sub_ids, sizes):
+        for shift in range(7 * (size - 1), 0, -7):
+            octets[pos] = (sn >> shift) & 0x7f | 0x80
+            pos += 1
+        octets[pos] = sn & 0x7f
+        pos += 1
+    return bytes(octets)
+
+
+# X.509证书和PKCS中反复出现的OID，以数值字节串为键预先解码，解码时直接查表
+_COMMON_OBJECT_IDENTIFIERS = MappingProxyType({
+    _encode_object_identifier(oid): oid for oid in (tuple(map(int, s.split('.'))) for s in (
+        '1.2.840.113549.1.1.1',  # rsaEncryption
+        '1.2.840.113549.1.1.5',  # sha1WithRSAEncryption
+        '1.2.840.113549.1.1.10',  # RSASSA-PSS
+        '1.2.840.113549.1.1.11',  # sha256WithRSAEncryption
+        '1.2.840.113549.1.1.12',  # sha384WithRSAEncryption
+        '1.2.840.113549.1.1.13',  # sha512WithRSAEncryption
+        '1.2.840.113549.1.9.1',  # emailAddress
+        '1.2.840.10045.2.1',  # ecPublicKey
+        '1.2.840.10045.3.1.7',  # prime256v1
+        '1.2.840.10045.4.3.2',  # ecdsa-with-SHA256
+        '1.2.840.10045.4.3.3',  # ecdsa-with-SHA384
+        '1.3.132.0.34',  # secp384r1
+        '1.2.156.10197.1.301',  # sm2
+        '1.2.156.10197.1.401',  # sm3
+        '1.2.156.10197.1.501',  # SM2-with-SM3
+        '2.16.840.1.101.3.4.2.1',  # sha256
+        '2.5.4.3',  # commonName
+        '2.5.4.5',  # serialNumber
+        '2.5.4.6',  # countryName
+        '2.5.4.7',  # localityName
+        '2.5.4.8',  # stateOrProvinceName
+        '2.5.4.10',  # organizationName
+        '2.5.4.11',  # organizationalUnitName
+        '2.5.29.14',  # subjectKeyIdentifier
+        '2.5.29.15',  # keyUsage
+        '2.5.29.17',  # subjectAltName
+        '2.5.29.19',  # basicConstraints
+        '2.5.29.31',  # cRLDistributionPoints
+        '2.5.29.32',  # certificatePolicies
+        '2.5.29.35',  # authorityKeyIdentifier
+        '2.5.29.37',  # extKeyUsage
+        '1.3.6.1.5.5.7.1.1',  # authorityInfoAccess
+        '1.3.6.1.5.5.7.3.1',  # serverAuth
+        '1.3.6.1.5.5.7.3.2',  # clientAuth
+        '1.3.6.1.5.5.7.48.1',  # ocsp
+        '1.3.6.1.5.5.7.48.2',  # caIssuers
+        '1.3.6.1.4.1.11129.2.4.2',  # SCT list
+    ))
+})
+
+
 class ASN1ObjectIdentifier(ASN1DataType):
     """X.690 8.19 Object Identifier (OID)
 
@@ -363,8 +439,11 @@ class ASN1ObjectIdentifier(ASN1DataType):
     令OID的第一个元素为X，第二个元素为Y，则第一个子id为 (X * 40) + Y。
     其他的子元素依次与后续的子id编码相同。
     """
+    __slots__ = ('_oid_string',)  # OID在证书中大量出现，不为每个实例保留__dict__
+
     def __init__(self, value: Union[str, Sequence[int]] = None, length: Length = None,
                  value_octets: bytes = None, der: bool = False):
+        self._oid_string = None  # 总是由数值生成规范形式，输入字符串可能带有前导0
         super().__init__(value, length, value_octets, der)
 
     @property
@@ -376,48 +455,36 @@ class ASN1ObjectIdentifier(ASN1DataType):
         return 'ObjectIdentifier'
 
     @property
-    def oid_string(self):
-        return '.'.join((f'{n}' for n in self._value))
+    def oid_string(self) -> str:
+        if self._oid_string is None:  # 数值不可变，字符串形式只需生成一次
+            self._oid_string = '.'.join(map(str, self._value))
+        return self._oid_string
 
     def decode_value(self, octets: bytes, der: bool):
-        sub_ids = []
-        sn = 0
-        for b in octets:
-            if sn == 0 and b == 0x80:
-                raise InvalidEncoding("ObjectIdentifier中subidentifier的首字节不能为0x80", octets)
-            sn = (sn << 7) | (b & 0x7f)
-            if b & 0x80 == 0:
-                sub_ids.append(sn)
-                sn = 0
-
-        if octets[-1] & 0x80 != 0:
-            raise InvalidEncoding("ObjectIdentifier中末尾subidentifier未结束", octets)
-
-        x, y = divmod(sub_ids[0], 40) if sub_ids[0] < 80 else (2, sub_ids[0] - 80)
+        components = _COMMON_OBJECT_IDENTIFIERS.get(bytes(octets))
+        if components is not None:  # 常用OID直接查表
+            return components
+        return _decode_object_identifier(octets)
 
-        return x, y, *sub_ids[1:]
-
-    STRING_PATTERN: re.Pattern = re.compile(r'^[012](\.[0-9]+)+$')
+    STRING_PATTERN: re.Pattern = re.compile(r'^[012](\.[0-9]+)+\Z')  # \Z不同于$，不接受末尾换行
 
     def encode_value(self, value) -> bytes:
         if isinstance(value, str):
+            # 正则仅做一次整体校验（int()本身会接受'+1'、'1_0'、空白等非法形式），元素转换交由map在C层完成
             if not ASN1ObjectIdentifier.STRING_PATTERN.match(value):
                 raise ValueError("ObjectIdentifier不正确：{}".format(value))
-            oid = [int(item) for item in value.split('.')]
-            self._value = tuple(oid)
+            oid = tuple(map(int, value.split('.')))
+            self._value = oid
         else:
-            oid = value
+            oid = tuple(value)
+            self._value = oid
         if len(oid) < 2 or (not 0 <= oid[0] < 3) or (not 0 <= oid[1] < 40):
             raise ValueError("ObjectIdentifier不正确：{}".format(value))
 
-        octets = bytearray()
-        for comp in reversed((oid[0] * 40 + oid[1], *oid[2:],)):
-            octets.append(comp & 0x7f)
-            comp >>= 7
-            while comp > 0:
-                octets.append(comp & 0x7f | 0x80)
-                comp >>= 7
-        return bytes(reversed(octets))
+        return _encode_object_identifier(oid)
+
+    def __hash__(self):
+        return hash(self._value)
 
     def __repr__(self) -> str:
         return self._repr_common_format(meta_expr=f'(len={self._length.value})',
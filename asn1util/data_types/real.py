@@ -1,17 +1,57 @@
-from io import StringIO
-
-from asn1util.util import signed_int_to_bytes, unsigned_int_to_bytes
-from decimal import Decimal, localcontext
-from typing import Union, Tuple, Optional
+from asn1util.util import signed_int_to_bytes
+from decimal import Decimal
+import math
+from functools import lru_cache, singledispatch
+from typing import Union, Tuple, Optional, Sequence, List
 import struct
 from enum import IntEnum
 import logging
-import math
-from asn1util.exceptions import *
+from asn1util.exceptions import InvalidEncoding, UnsupportedValue
 
 
 logger = logging.getLogger(__name__)
 
+# IEEE 754 双精度浮点数各域的位数、偏移值和掩码常量，避免在每次调用中重复计算
+_DOUBLE_FRACTION_BITS = 52  # 分数域（尾数域）的位数
+_DOUBLE_EXPONENT_FIELD = 0x7ff  # 指数域（11比特）全1，表示无穷大或NaN
+_DOUBLE_EXPONENT_BIAS = 1023  # 正规数的指数偏移值 2 ** (11 - 1) - 1
+_DOUBLE_NORMAL_E_OFFSET = 1075  # 正规数指数域转为整数尾数的指数E需减去的值，即1023 + 52
+_DOUBLE_SUBNORMAL_E = -1074  # 次正规数整数尾数的指数E，即 1 - 1023 - 52
+_DOUBLE_FRACTION_MASK = (0x01 << 52) - 1  # 分数域（52比特）掩码
+_DOUBLE_IMPLICIT_BIT = 0x01 << 52  # 正规数尾数中隐含的整数位1
+_DOUBLE_MAX_EXPONENT_FIELD = (0x01 << 11) - 2  # 正规数指数域的最大值（全1表示无穷大或NaN）
+_DOUBLE_EXPONENT_MASK = 0x7ff << 52  # 指数域（11比特）在64位比特模式中的掩码
+_DOUBLE_MINUS_ZERO = 0x01 << 63  # -0.0的比特模式，仅符号位为1
+
+# 预编译的IEEE 754双精度数及其64位比特模式的打包格式（big-endian），避免每次调用解析格式串
+_DOUBLE_STRUCT = struct.Struct('>d')
+_UINT64_STRUCT = struct.Struct('>Q')
+
+
+# 二进制编码中b2b1=00/01时，1字节和2字节有符号指数的读取格式（X.690 8.5.7.4 a) b)）
+_EXPONENT_STRUCTS = (struct.Struct('>b'), struct.Struct('>h'))
+
+# 编码时首字节连同1字节或2字节有符号指数一次打包的格式
+_LEADING_EXPONENT_STRUCTS = (struct.Struct('>Bb'), struct.Struct('>Bh'))
+
+# 二进制编码幂底数对应的b6,b5标记位和以2为底的指数的除数，X.690 8.5.7.2
+_BINARY_BASE_ENCODING = {2: (0x00, 1), 8: (0x10, 3), 16: (0x20, 4)}
+
+# 按b6,b5索引的二进制编码幂底数，及其指数折算为以2为底时的乘数，b6,b5=11为保留值
+_BINARY_BASE_DECODING = ((2, 1), (8, 3), (16, 4))
+
+
+def _strip_trailing_zeros(n: int, e: int) -> Tuple[int, int]:
+    """去除尾数N末尾的0比特并相应增大指数E，X.690 8.5.7.5 CER和DER格式要求n的最低位bit=1
+
+    n & -n只保留最低位的1，其位长减1即为末尾0的个数（count trailing zeros）；n为0时原样返回。
+    """
+    if n:
+        tz = (n & -n).bit_length() - 1
+        return n >> tz, e + tz
+    return n, e
+
+
 class SpecialRealValue(IntEnum):
     """特殊类型实数的表示类
 
@@ -29,64 +69,66 @@ class SpecialRealValue(IntEnum):
     MINUS_ZERO = 0x43
     """-0.0"""
 
+    def __init__(self, value: int):
+        self._octets = bytes((value,))  # 各成员的编码（X.690 8.5.9）在定义时生成一次
+
     def to_float(self) -> float:
         """转为浮点数"""
-        return SPECIAL_REAL_VALUE_CONVERSION[self][0]
+        return _SPECIAL_REAL_FLOATS[self - 0x40]
 
     def to_decimal(self) -> Decimal:
         """转为十进制数"""
-        return SPECIAL_REAL_VALUE_CONVERSION[self][1]
+        return _SPECIAL_REAL_DECIMALS[self - 0x40]
 
     @property
     def octets(self) -> bytes:
-        return bytes((self.value,))
+        return self._octets
 
     @staticmethod
     def eval(byte: int) -> 'SpecialRealValue':
-        try:
-            return SpecialRealValue(byte)
-        except ValueError as ve:
-            raise InvalidEncoding(f'Byte value 0x{byte:01x} is not special.')
+        if 0x40 <= byte <= 0x43:  # 取值范围检查代替枚举构造失败时的异常捕获
+            return _SPECIAL_REAL_VALUES[byte - 0x40]
+        raise InvalidEncoding(f'Byte value 0x{byte:01x} is not special.')
 
     @staticmethod
     def from_float(value: float) -> 'SpecialRealValue':
-        if math.isinf(value):
-            return SpecialRealValue.PLUS_INFINITY if value > 0 else SpecialRealValue.MINUS_INFINITY
-        elif math.isnan(value):
-            return SpecialRealValue.NOT_A_NUMBER
-        elif value == 0.0 and math.copysign(1.0, value) < 0.0:
-            return SpecialRealValue.MINUS_ZERO
-
-        raise ValueError(f'Float value {value:f} is not special.')
+        if (srv := _special_value_of_double(value)) is None:
+            raise ValueError(f'Float value {value:f} is not special.')
+        return srv
 
     @staticmethod
     def from_decimal(dec: Decimal) -> 'SpecialRealValue':
-        if dec.is_nan():
-            return SpecialRealValue.NOT_A_NUMBER
-        elif dec.is_zero():
-            if dec.is_signed():
-                return SpecialRealValue.MINUS_ZERO
-            else:
-                raise ValueError("Decimal表示的不是特殊实数")
-        elif dec.is_infinite():
-            if dec.is_signed():
-                return SpecialRealValue.MINUS_INFINITY
-            else:
-                return SpecialRealValue.PLUS_INFINITY
-
-        raise ValueError(f'Decimal value {dec} is not special.')
+        if (srv := _special_value_of_decimal(dec)) is None:
+            raise ValueError(f'Decimal value {dec} is not special.')
+        return srv
 
     @staticmethod
     def check_special_value(value: Union[float, Decimal]) -> Optional['SpecialRealValue']:
-        try:
-            if isinstance(value, float):
-                sv = SpecialRealValue.from_float(value)
-                return sv
-            if isinstance(value, Decimal):
-                sv = SpecialRealValue.from_decimal(value)
-                return sv
-        except ValueError:
-            return None
+        # 普通数值直接返回None，不经过from_float/from_decimal的异常抛出和捕获
+        if isinstance(value, float):
+            return _special_value_of_double(value)
+        if isinstance(value, Decimal):
+            return _special_value_of_decimal(value)
+        return None
+
+
+def _special_value_of_double(value: float) -> Optional[SpecialRealValue]:
+    """按IEEE 754比特模式对双精度数分类，特殊数返回对应的SpecialRealValue，普通数返回None"""
+    bits = _UINT64_STRUCT.unpack(_DOUBLE_STRUCT.pack(value))[0]
+    if bits & _DOUBLE_EXPONENT_MASK != _DOUBLE_EXPONENT_MASK:  # 指数域不全为1的有限数，仅-0.0为特殊数
+        return SpecialRealValue.MINUS_ZERO if bits == _DOUBLE_MINUS_ZERO else None
+    if bits & _DOUBLE_FRACTION_MASK:
+        return SpecialRealValue.NOT_A_NUMBER
+    return SpecialRealValue.MINUS_INFINITY if bits >> 63 else SpecialRealValue.PLUS_INFINITY
+
+
+def _special_value_of_decimal(dec: Decimal) -> Optional[SpecialRealValue]:
+    """对十进制数分类，特殊数返回对应的SpecialRealValue，普通数返回None"""
+    if dec.is_finite():  # 有限数中仅-0为特殊数
+        return SpecialRealValue.MINUS_ZERO if dec.is_zero() and dec.is_signed() else None
+    if dec.is_nan():
+        return SpecialRealValue.NOT_A_NUMBER
+    return SpecialRealValue.MINUS_INFINITY if dec.is_signed() else SpecialRealValue.PLUS_INFINITY
 
 
 SPECIAL_REAL_VALUE_CONVERSION = {
@@ -96,6 +138,11 @@ SPECIAL_REAL_VALUE_CONVERSION = {
     SpecialRealValue.MINUS_ZERO: (-0.0, Decimal('-0'))
 }
 
+# 特殊实数取值为连续的0x40~0x43，按(值 - 0x40)索引元组代替字典查找
+_SPECIAL_REAL_VALUES = tuple(SpecialRealValue)
+_SPECIAL_REAL_FLOATS = tuple(SPECIAL_REAL_VALUE_CONVERSION[srv][0] for srv in SpecialRealValue)
+_SPECIAL_REAL_DECIMALS = tuple(SPECIAL_REAL_VALUE_CONVERSION[srv][1] for srv in SpecialRealValue)
+
 
 def decimal_to_base2_sne(value: Decimal, byte_length: int = 8) -> Tuple[int, int, int]:
     """将Decimal类型的十进制数转化为ASN.1格式且以2为底的的S,N,E。
@@ -108,30 +155,29 @@ def decimal_to_base2_sne(value: Decimal, byte_length: int = 8) -> Tuple[int, int
     :return: (S, N, E) 并且 abs(value) ~= N * pow(2, E)
     """
     logger.warning("Decimal浮点数转二进制表示时方法通常存在精度损失/Possible precision lost in decimal to binary.")
-    ds, dd, de = value.as_tuple()  # 将十进制数分解为符号sign、数字digits、指数exponent
-    di, df = (dd, None) if de >= 0 else (dd[0:de], dd[de:]) if len(dd) > -de else (None, dd)  # 数字部分分解为整数和小数部分
-    fp = Decimal((0, df, de)) if df else Decimal(0)  # 小数部分的十进制表示
-    ip = Decimal((0, di, de if de > 0 else 0)) if di else Decimal(0)  # 整数部分的十进制表示
-
-    s: int = ds  # 符号位，1为正，-1为负
-    n: int = int(ip.to_integral_exact())  # 整数部分的int表示
-    if n.bit_length() > byte_length * 8:  # 整数部分溢出
-        raise ValueError(f"数值溢出，实际需要字节数{n.bit_length() // 8 + 1}")
-    frac_bits_len = byte_length * 8 - n.bit_length()  # 小数部分的比特数
-
-    for i in range(frac_bits_len):  # 十进制纯小数转化为二进制表示
-        fp *= 2  # 纯小数部分乘以2，如果大于1，则在二进制结果中追加1
-        n <<= 1  # 整数部分左移1位，空出最低1位追加小数部分二进制结果
-        if fp > 1:
-            n += 1
-            fp -= 1
-
-    e: int = 0 - frac_bits_len  # 二进制的指数等于小数部分bit长度的相反数
-    while n & 0x01 == 0:  # X.690 8.5.7.5 CER和DER格式要求n的最低位bit=1
+    num, den = value.as_integer_ratio()  # 十进制数精确等于最简分数num / den
+    s: int = 1 if num < 0 else 0  # 符号位，非0表示负数
+    num = abs(num)
+    int_bits_len = (num // den).bit_length()  # 整数部分的比特数
+    if int_bits_len > byte_length * 8:  # 整数部分溢出
+        raise ValueError(f"数值溢出，实际需要字节数{int_bits_len // 8 + 1}")
+    if num == 0:  # X.690 8.5.2 零值没有S,N,E表示，由调用方编码为空内容
+        return 0, 0, 0
+
+    # 按分子分母的位长估计左移位数k，使 n = num * 2^k // den 恰有byte_length * 8个有效比特，
+    # 这样纯小数（如1e-20）也保留完整精度，不会因只截取固定位数的小数部分而下溢为0
+    n_bits_len = byte_length * 8
+    k = n_bits_len - (num.bit_length() - den.bit_length())
+    n = (num << k) // den if k >= 0 else num // (den << -k)
+    if n.bit_length() > n_bits_len:  # 估计值偏大1位时修正，floor(floor(x) / 2) == floor(x / 2)
         n >>= 1
-        e += 1
-    return s, n, e
+        k -= 1
+
+    e: int = 0 - k  # 二进制的指数等于左移位数的相反数
+    return (s, *_strip_trailing_zeros(n, e))
 
+
+@lru_cache(maxsize=4096)  # 整数实数多为0、±1、±10等少数常见值，结果为不可变元组，可直接缓存
 def int_to_base2_sne(value: int):
     """将int类型的整数转化为ASN.1格式且以2为底的的S,N,E
 
@@ -140,11 +186,7 @@ def int_to_base2_sne(value: int):
     :return: (S, N, E) 并且 abs(value) == N * pow(2, E)
     """
     s, n = (-1, -value) if value < 0 else (0, value)
-    e = 0
-    while n & 0x01 == 0:  # X.690 8.5.7.5 CER和DER格式要求n的最低位bit=1
-        n >>= 1
-        e += 1
-    return s, n, e
+    return (s, *_strip_trailing_zeros(n, 0))
 
 
 def ieee754_double_to_base2_sne(float_octets: bytes) -> Union[Tuple[int, int, int], SpecialRealValue]:
@@ -154,11 +196,52 @@ def ieee754_double_to_base2_sne(float_octets: bytes) -> Union[Tuple[int, int, in
     :param float_octets: IEEE 754表示双精度数的字节串，big-endian编码
     :return: (S, N, E)并且 abs(value) = N * pow(2, E)或者特殊类型数
     """
-    sign = float_octets[0] >> 7
+    return _ieee754_bits_to_base2_sne(_UINT64_STRUCT.unpack(float_octets)[0])
+
+
+def ieee754_doubles_to_base2_sne(buffer: bytes) -> List[Union[Tuple[int, int, int], SpecialRealValue]]:
+    """批量将连续存放的IEEE 754双精度浮点数转为S,N,E或者特殊数
+
+    逐个64位整数迭代读出比特模式，省去逐个数值的切片和打包。
+    :param buffer: 若干个8字节IEEE 754双精度数依次拼接的字节串，big-endian编码
+    :return: 与各双精度数一一对应的(S, N, E)或者特殊类型数
+    """
+    if len(buffer) % 8:
+        raise ValueError("IEEE 754双精度数字节串长度{}不是8的整数倍".format(len(buffer)))
+    return [_ieee754_bits_to_base2_sne(bits) for bits, in _UINT64_STRUCT.iter_unpack(buffer)]
+
+
+def float_to_base2_sne(value: float) -> Union[Tuple[int, int, int], SpecialRealValue]:
+    """将float类型的双精度浮点数转化为ASN.1格式且以2为底的S,N,E或者特殊数
+
+    :param value: 双精度浮点数
+    :return: (S, N, E)并且 abs(value) = N * pow(2, E)或者特殊类型数
+    """
+    try:
+        # 有限浮点数精确等于最简分数num / den，其中den为2的幂，非整数时num必为奇数
+        num, den = value.as_integer_ratio()
+    except (OverflowError, ValueError):  # 无穷大或NaN
+        return SpecialRealValue.from_float(value)
+    if num == 0:
+        return SpecialRealValue.MINUS_ZERO if math.copysign(1.0, value) < 0 else (0, 0, 0)
+
+    s, n = (-1, -num) if num < 0 else (0, num)
+    if den > 1:  # X.690 8.5.7.5 分数已约分，n的最低位bit已为1
+        return s, n, 1 - den.bit_length()
+    return (s, *_strip_trailing_zeros(n, 0))
+
+
+def _ieee754_bits_to_base2_sne(bits: int) -> Union[Tuple[int, int, int], SpecialRealValue]:
+    """以64位无符号整数表示的IEEE 754双精度浮点数比特模式转为S,N,E或者特殊数
+
+    :param bits: 整体按64位无符号整数读出的IEEE 754双精度浮点数，再用移位和掩码取各域
+    :return: (S, N, E)并且 abs(value) = N * pow(2, E)或者特殊类型数
+    """
+    sign = bits >> 63
     # 符号位为首个bit
-    exp = (((float_octets[0] & 0x7f) << 4) | ((float_octets[1] >> 4) & 0x0f))
+    exp = (bits >> _DOUBLE_FRACTION_BITS) & _DOUBLE_EXPONENT_FIELD
     # 指数（exponential）域bit数e = 11
-    frac = int.from_bytes(float_octets[2:], byteorder='big', signed=False) + ((float_octets[1] & 0x0f) << 48)
+    frac = bits & _DOUBLE_FRACTION_MASK
     # 分数（fraction)域转化为整数，共52个比特
 
     """
@@ -175,22 +258,40 @@ def ieee754_double_to_base2_sne(float_octets: bytes) -> Union[Tuple[int, int, in
             s: int = -1 if sign else 0
             n: int = frac
             # frac是以整数形式表示的小数部分，其中次正规数约定整数部分为0。因此转化为n的时候实际上左移了52位，那么2的指数e应当相应减52。
-            e: int = -1074
+            e: int = _DOUBLE_SUBNORMAL_E
             # 次正规数的指数偏移值为2 ** (e - 1) - 2 即1022，那么转化为e即为exp - 1022 - 52 = -1074
-    elif exp == 0x07ff:  # 无穷大或NaN
+    elif exp == _DOUBLE_EXPONENT_FIELD:  # 无穷大或NaN
         return (SpecialRealValue.MINUS_INFINITY if sign else SpecialRealValue.PLUS_INFINITY) if frac == 0 \
             else SpecialRealValue.NOT_A_NUMBER
     else:  # 正规数（规约形式）
-        frac |= 0x10 << 48  # 补上整数部分的1
+        frac |= _DOUBLE_IMPLICIT_BIT  # 补上整数部分的1
         s: int = -1 if sign else 0
         n: int = frac
-        e: int = exp - 1075
+        e: int = exp - _DOUBLE_NORMAL_E_OFFSET
         # IEEE754标准规定指数偏移值是2 ** (e - 1) - 1，即1023，那么转化为e即为exp - 1023 - 52 = -1075
 
-    while n & 0x01 == 0:  # X.690 8.5.7.5 CER和DER格式要求n的最低位bit=1
-        n >>= 1
-        e += 1
-    return s, n, e
+    return (s, *_strip_trailing_zeros(n, e))
+
+
+def floats_to_binary_encodings(values: Sequence[float], base: int = 2) -> List[bytes]:
+    """批量将双精度浮点数按照ASN.1 Real格式规范进行二进制编码
+
+    整组数值通过一次struct打包再按64位无符号整数读出，省去逐个数值的打包和切片。
+    :param values: 待编码的浮点数序列
+    :param base: 幂底数，取值范围为2、8、16
+    :return: 与values一一对应的编码后字节串（不含标签和长度）
+    """
+    count = len(values)
+    result = []
+    for bits in struct.unpack(f'>{count}Q', struct.pack(f'>{count}d', *values)):
+        sne = _ieee754_bits_to_base2_sne(bits)
+        if isinstance(sne, SpecialRealValue):
+            result.append(sne.octets)
+        elif sne[1] == 0:  # X.690 8.5.2 正零的内容为空
+            result.append(b'')
+        else:
+            result.append(to_binary_encoding(*sne, base))
+    return result
 
 
 def to_binary_encoding(s:int, n: int, e: int, base: int = 2) -> bytes:
@@ -203,101 +304,145 @@ def to_binary_encoding(s:int, n: int, e: int, base: int = 2) -> bytes:
     :param base: 幂底数，取值范围为2、8、16
     :return: 编码后的字节串
     """
-    leading: int = 0x80  # b8 = 1，表示二进制（8.5.6）
-    #  b7为符号位（8.5.7.1）
-    if s != 0:  # b7 = 1 if s = -1 or 0 otherwise
-        leading |= 0x40
-
+    if n == 0:  # X.690 8.5.2 零值的内容为空，应由调用方处理，二进制编码的尾数不能为0
+        raise ValueError("二进制编码的尾数N不能为0，零值应编码为空内容")
     #  b6,b5为进制位（8.5.7.2、8.5.7.3）
-    f = 0  # 指数的余数
     """
     当base选择8或者16时，以2为底的指数会出现余数的情况，编码中必须将余数保留。
     即 {2^e = 2^{3*e_8+f_8} = 8^e_8 * 2^f_8} 或 {2^e = 2^{4*e_16+f_16} = 16^e_16 * 2^f_16}。
     如 {e = 35} 时，2 ^ 35 = 16 ^ 8 * 2 ^ 3，则存储时选base=16时，e = e //4，f = e % 4。
     """
-    if base == 8:  # b6,b5=01，表示八进制
-        leading |= 0x10
-        e, f = divmod(e, 3)
-    elif base == 16:  # b6,b5=10，表示十六进制
-        leading |= 0x20
-        e, f = divmod(e, 4)
-    #  b4,b3为F值用于八进制和六十进制的指数余数
-    leading |= (f << 2)  # b4,b3
-
-    data = bytearray()
+    try:
+        base_bits, exp_divisor = _BINARY_BASE_ENCODING[base]
+    except KeyError:
+        raise ValueError("二进制编码的幂底数仅限2、8、16，实际为{}".format(base))
+    e, f = divmod(e, exp_divisor)  # 底数为2时除数为1，余数f恒为0
+    # b8 = 1表示二进制（8.5.6），b7为符号位（8.5.7.1，s非0时为1），b4,b3为F值用于八进制和十六进制的指数余数
+    leading: int = 0x80 | ((s != 0) << 6) | base_bits | (f << 2)
+
+    n_octets = n.to_bytes((n.bit_length() + 7) // 8, byteorder='big')  # 8.5.7.5 尾数为无符号整数
+
     #  b2,b1标记指数长度，指数用二进制补码表示（two's complement binary number）（8.5.7.4）
-    exp_octets = signed_int_to_bytes(e)
+    # 常见的1、2字节指数（b2b1=00/01）与首字节一次打包，无需计算补码字节串
+    if -0x80 <= e < 0x80:
+        return _LEADING_EXPONENT_STRUCTS[0].pack(leading, e) + n_octets
+    elif -0x8000 <= e < 0x8000:
+        return _LEADING_EXPONENT_STRUCTS[1].pack(leading | 0x01, e) + n_octets
+
+    exp_octets = signed_int_to_bytes(e)  # 仅超过2字节的指数才会用到，不是常用路径
     exp_len = len(exp_octets)
 
     if exp_len > 255:
         raise UnsupportedValue("指数部分长度{}超过255".format(exp_len))
-    elif exp_len < 3:  # 8.5.7.4 b2b1=00/01/02
-        leading |= (exp_len - 1) & 0x03
-        data.append(leading)
+    elif exp_len <= 3:  # 8.5.7.4 b2b1=00/01/10
+        leading |= exp_len - 1
+        header_len = 1
     else:  # 8.5.7.4 b2b1=11 d)
         leading |= 0x03
-        data.append(leading)
-        data.append(exp_len)
-    data.extend(exp_octets)
-    data.extend(unsigned_int_to_bytes(n))  # 8.5.7.5
+        header_len = 2
+
+    # 预先计算总长度，一次分配后按固定偏移写入各部分
+    exp_end = header_len + exp_len
+    data = bytearray(exp_end + len(n_octets))
+    data[0] = leading
+    if header_len == 2:
+        data[1] = exp_len
+    data[header_len:exp_end] = exp_octets
+    data[exp_end:] = n_octets
     return bytes(data)
 
 
+def from_binary_encoding(octets: bytes) -> Tuple[int, int, int, int]:
+    """按照ASN.1 Real格式规范解析二进制编码，是to_binary_encoding的逆运算
+
+    X.690 8.5.7 (P8)
+    :param octets: 首字节b8=1的实数Real类型内容字节
+    :return: (S, N, E, base)，其中E已折算为以2为底的指数，即 abs(value) = N * pow(2, E)
+    """
+    leading = octets[0]
+    s: int = -1 if leading & 0x40 else 0  # b7为符号位（8.5.7.1）
+
+    if (b2b1 := leading & 0x03) < 0x02:  # 常见的1、2字节指数直接用struct读取有符号整数
+        try:
+            e: int = _EXPONENT_STRUCTS[b2b1].unpack_from(octets, 1)[0]
+        except struct.error:
+            raise InvalidEncoding("实数Real类型指数部分长度不足")
+        n_offset = b2b1 + 2
+    else:  # b2b1=10时指数占3字节，b2b1=11时第2字节为指数长度（8.5.7.4 c) d)），统一为一次切片
+        long_form = b2b1 & 0x01
+        if len(octets) < 2:
+            raise InvalidEncoding("实数Real类型指数部分长度不足")
+        exp_offset = 1 + long_form
+        n_offset = exp_offset + (octets[1] if long_form else 3)
+        if len(octets) < n_offset:
+            raise InvalidEncoding("实数Real类型指数部分长度不足")
+        e: int = int.from_bytes(octets[exp_offset:n_offset], byteorder='big', signed=True)
+    n: int = int.from_bytes(octets[n_offset:], byteorder='big')  # 8.5.7.5
+
+    #  b6,b5为进制位，b4,b3为以2为底的指数余数F（8.5.7.2、8.5.7.3）
+    if (b6b5 := (leading & 0x30) >> 4) == 0x03:
+        raise InvalidEncoding("二进制底数保留值{}".format(hex(leading)))
+    base, exp_multiplier = _BINARY_BASE_DECODING[b6b5]
+    return s, n, e * exp_multiplier + ((leading & 0x0c) >> 2), base
+
+
+@singledispatch
 def to_decimal_encoding(value: Union[int, float, Decimal]) -> bytes:
     """按照ASN.1 Real格式规范将整数int或十进制数Decimal进行十进制编码
 
     X.690 8.5.8 (P8)
     X.690 11.3.2 (P20)
     注意：通常不应选择用十进制方式保存二进制浮点数，以免出现精度损失情况。如确有需要，可以通过Decimal转换为特定精度。
+    按值的类型分派到int、float、Decimal各自的实现。
 
     :param value: 整数int或者十进制数Decimal
     """
-    if isinstance(value, float):
-        value = Decimal(str(value))
-
-    buffer = StringIO()
-    if isinstance(value, int):
-        if value < 0:
-            buffer.write('-')
-            abs_value = -1 * value
-        else:
-            abs_value = value
+    raise ValueError("数据{}类型不是int或Decimal".format(value))
 
-        exp = 0
-        while abs_value % 10 == 0:
-            exp += 1
-            abs_value /= 10
 
-        if exp == 0:
-            buffer.write('{:d}.E+0'.format(abs_value))
-        else:
-            buffer.write('{:d}.E{:d}'.format(abs_value, exp))
-        return buffer.getvalue().encode('ascii')
+# Decimal.as_tuple()的各位数字0~9到ASCII数字字符的转换表，整个数字元组一次转换
+_DIGIT_TRANSLATION = bytes.maketrans(bytes(range(10)), b'0123456789')
 
-    if isinstance(value, Decimal):
-        if srv := SpecialRealValue.check_special_value(value):
-            return srv.octets
-        sign, digits, exponent = value.as_tuple()
-        if sign != 0:
-            buffer.write('-')
 
-        while digits[-1] == 0:
-            exponent += 1
-            digits = digits[:-1]
+def _to_nr3_encoding(negative: bool, digits: bytes, exponent: int) -> bytes:
+    """将ASCII十进制数字串及其指数按ISO 6093 NR3格式编码，value = digits * 10 ** exponent
 
-        buffer.write('{:s}.E{:d}'.format(''.join([f'{d:d}' for d in digits]), exponent))
-        return b'\x03' + buffer.getvalue().encode('ascii')  # ISO 6093 NR3 form
+    X.690 11.3.2 (P20) 尾数去除末尾的0并相应增大指数，指数为0时写作'+0'，其他情况不出现'+'
+    """
+    mantissa = digits.rstrip(b'0')  # 一次性去除末尾的0
+    if not mantissa:  # X.690 8.5.2 零值没有内容字节
+        return b''
+    exponent += len(digits) - len(mantissa)
+    # 直接以bytes的%格式化拼出内容字节，省去str格式化后再encode
+    return b'\x03%s%s.E%s' % (b'-' if negative else b'', mantissa, b'%d' % exponent if exponent else b'+0')
 
-    raise ValueError("数据{}类型不是int或Decimal".format(value))
+
+@to_decimal_encoding.register(int)
+def _int_to_decimal_encoding(value: int) -> bytes:
+    return _to_nr3_encoding(value < 0, b'%d' % abs(value), 0)
+
+
+@to_decimal_encoding.register(float)
+def _float_to_decimal_encoding(value: float) -> bytes:
+    if srv := SpecialRealValue.check_special_value(value):
+        return srv.octets
+    # repr给出可精确还原的最短十进制表示，如'-1.5e-07'，直接拆分出数字串和指数而无需构造Decimal
+    significand, _, exp_string = repr(value).encode('ascii').partition(b'e')
+    int_string, _, frac_string = significand.lstrip(b'-').partition(b'.')
+    return _to_nr3_encoding(significand.startswith(b'-'), (int_string + frac_string).lstrip(b'0'),
+                            (int(exp_string) if exp_string else 0) - len(frac_string))
+
+
+@to_decimal_encoding.register(Decimal)
+def _decimal_to_decimal_encoding(value: Decimal) -> bytes:
+    if srv := SpecialRealValue.check_special_value(value):
+        return srv.octets
+    sign, digits, exponent = value.as_tuple()
+    return _to_nr3_encoding(sign != 0, bytes(digits).translate(_DIGIT_TRANSLATION), exponent)
 
 
 def to_ieee758_double(sign: int, number: int, exponent: int) -> float:
     """将数值为s * number * 2 ** exponent的浮点数转化为ieee 758格式"""
-    buffer = bytearray()
-    el, nl, bias = 11, 52, 1023
-    # 指数域的位数、尾数域的位数
-    # 指数偏移值 {2 ^ {el - 1} - 1} 2 ** (el - 1) - 1
-
     """
     尾数每右移1位，指数应当增加1以保持数值不变，若右移完成指数域（指数加偏移值）仍然小于0，则需要用次正规数表示或者向下溢出到0。
     需要将尾数右移至整数部分仅为1，根据相应的指数域判断属于正规数、次正规数、下溢出或上溢出。
@@ -306,44 +451,39 @@ def to_ieee758_double(sign: int, number: int, exponent: int) -> float:
 
     n_bit_len = number.bit_length()
 
-    if n_bit_len > nl + 1:
+    if n_bit_len > _DOUBLE_FRACTION_BITS + 1:
         # 尾数精度超过浮点数规定，按正规数的尾数域长度加整数位数1右移，进行舍弃精度
-        r_shift = n_bit_len - nl - 1
+        r_shift = n_bit_len - _DOUBLE_FRACTION_BITS - 1
         number >>= r_shift
         n_bit_len -= r_shift
-        assert n_bit_len == number.bit_length()
         exponent += r_shift  # 对应地增加指数域
         logger.warning("尾数过长造成精度损失{:d}位".format(r_shift))
 
     r_shift = n_bit_len - 1  # 若正规数可表示（或上溢出），尾数应当右移的位数（除最高位1以外的其他位数）
-    exponent_part = exponent + r_shift + bias
-    if exponent_part > (1 << el) - 2:
+    exponent_part = exponent + r_shift + _DOUBLE_EXPONENT_BIAS
+    if exponent_part > _DOUBLE_MAX_EXPONENT_FIELD:
         logger.warning("上溢出")
         return float('-inf') if sign < 0 else float('inf')
-    elif exponent_part > 0:  # 正规数可表示（或上溢出）
-        significant = (number << (nl - r_shift)) & ((1 << nl) - 1)
-        # 有效数（significant）部分等同于尾数（mantissa）左移尾数域位数再右移除最高位1以外的其他位数
-
-    else:  # 次正规数表示或下溢出
-        exponent_part = 0
-        r_shift = 1 - exponent - bias
-        # 要使次正规数的指数域为0的右移位数
-        # 注意：次正规数的指数偏移值为bias - 1
-        # 即 exponent + bias - 1 + r_shift = 0
-
-        if r_shift > n_bit_len + nl:  # 执行右移以后尾数域将为0
-            logger.warning("下溢出")
-            return -0.0 if sign < 0 else 0.0
-        if nl < r_shift:  # 右移以后发生精度损失
-            logger.warning("指数过小造成精度损失{:d}位".format(nl - r_shift))
-            significant = number >> (r_shift - nl)
-        else:
-            significant = number << (nl - r_shift)
-
-    e_bytes = exponent_part.to_bytes(2, byteorder='big', signed=False)
-    n_bytes = significant.to_bytes(7, byteorder='big', signed=False)
-    buffer.append((0x80 if sign < 0 else 0x00) | ((e_bytes[0] & 0x07) << 4) | ((e_bytes[1] & 0xf0) >> 4))
-    buffer.append(((e_bytes[1] & 0x0f) << 4) | (n_bytes[0] & 0x0f))
-    buffer.extend(n_bytes[1:])
-    return struct.unpack('>d', bytes(buffer))[0]
+    elif exponent_part > 0:  # 正规数可表示
+        # 尾数已不超过53位且结果不会溢出，ldexp计算 number * 2 ** exponent 是精确的，无需拼装比特
+        return math.ldexp(-number if sign < 0 else number, exponent)
+
+    # 次正规数表示或下溢出
+    r_shift = 1 - exponent - _DOUBLE_EXPONENT_BIAS
+    # 要使次正规数的指数域为0的右移位数
+    # 注意：次正规数的指数偏移值为偏移值减1
+    # 即 exponent + _DOUBLE_EXPONENT_BIAS - 1 + r_shift = 0
+
+    if r_shift > n_bit_len + _DOUBLE_FRACTION_BITS:  # 执行右移以后尾数域将为0
+        logger.warning("下溢出")
+        return -0.0 if sign < 0 else 0.0
+    if _DOUBLE_FRACTION_BITS < r_shift:  # 右移以后发生精度损失
+        logger.warning("指数过小造成精度损失{:d}位".format(_DOUBLE_FRACTION_BITS - r_shift))
+        significant = number >> (r_shift - _DOUBLE_FRACTION_BITS)
+    else:
+        significant = number << (_DOUBLE_FRACTION_BITS - r_shift)
+
+    # 次正规数的指数域为0，符号位和分数域直接拼成64位整数，按64位无符号整数打包后以双精度数读出
+    bits = ((sign < 0) << 63) | (significant & _DOUBLE_FRACTION_MASK)
+    return _DOUBLE_STRUCT.unpack(_UINT64_STRUCT.pack(bits))[0]
 
@@ -6,6 +6,17 @@ from io import BytesIO
 
 logger = logging.getLogger(__name__)
 
+# 长表示形式标签的后续字节数上限，每字节7比特，标签数值不超过63比特
+_MAX_TAG_NUMBER_OCTETS = 9
+
+# 长格式长度的后续字节数上限，长度值不超过64比特，足以表示任何实际的流偏移值
+_MAX_LENGTH_OCTETS = 8
+
+# 解码出的标签对象按字节串共享（Tag构造后不再修改），实际数据中的标签种类很少，上限防止恶意输入使缓存无限增长
+_TAG_CACHE = {}
+_TAG_CACHE_SIZE = 1024
+
+
 class Tag:
     """处理标签（Tag）格式的类
 
@@ -59,9 +70,12 @@ class Tag:
             if tag_len == 1:
                 raise InvalidEncoding('首字节b5-b1为11111但没有后续字节/'
                                       'Leading byte b5-b1=11111 without following octets', octets)
+            if tag_len - 1 > _MAX_TAG_NUMBER_OCTETS:
+                raise InvalidEncoding('标签后续字节数{0:d}超过{1:d}/Subsequent tag octets {0:d} over {1:d}'
+                                      .format(tag_len - 1, _MAX_TAG_NUMBER_OCTETS), octets)
             self._number = 0
             for ind, octet in enumerate(octets[1:], 1):
-                if ind == 1 and octet & 0x3f == 0:  # 首个后续字节的b7-b1不能全为0
+                if ind == 1 and octet & 0x7f == 0:  # 首个后续字节的b7-b1不能全为0（X.690 8.1.2.4.2 c)）
                     raise InvalidEncoding('首个后续字节的b7-b1全为0/'
                                           'First subsequent byte with b7-b1 all 0', octets)
                 if ind == tag_len - 1:  # 末字节
@@ -69,6 +83,7 @@ class Tag:
                         raise InvalidEncoding('末字节的b8为1', octets)
                 elif octet & 0x80 == 0:
                     raise InvalidEncoding('非末字节的b8为0', octets)
+                self._number = (self._number << 7) | (octet & 0x7f)  # 各后续字节的b7-b1依次拼接为标签数值
             if strict and self._number < 0x1f:
                 raise InvalidEncoding('首字节b5-b1为11111但标签数值小于31', octets)
 
@@ -101,7 +116,7 @@ class Tag:
                 f'type={"P" if self.is_primitive else "C"}')
 
     def __eq__(self, other: 'Tag'):
-        return self._octets == other._octets
+        return self is other or self._octets == other._octets
 
     def __hash__(self):
         return hash(self._octets)
@@ -166,22 +181,55 @@ class Tag:
         :param data:输入的字节串或流
         """
         if isinstance(data, bytes) or isinstance(data, bytearray):
-            data = BytesIO(data)
+            return Tag.decode_from(data)[0]
         leading = data.read(1)
         if len(leading) == 0:  # EOF of data
             return None
 
         if leading[0] & 0x1f != 0x1f:  # Low tag number form
-            return Tag(leading)
+            return Tag._intern(leading)
 
-        buffer = bytearray()
-        buffer.append(leading[0])
-        while leading := data.read(1):
-            buffer.extend(leading)
-            if leading[0] & 0x80 == 0:
+        # 至多读取上限加1个后续字节，超出上限时由Tag构造时报错，避免恶意输入导致无限读取
+        buffer = bytearray(leading)
+        while len(buffer) <= _MAX_TAG_NUMBER_OCTETS + 1 and (octet := data.read(1)):
+            buffer += octet
+            if octet[0] & 0x80 == 0:
                 break
 
-        return Tag(bytes(buffer))
+        return Tag._intern(bytes(buffer))
+
+    @staticmethod
+    def decode_from(buffer: Union[bytes, bytearray, memoryview], offset: int = 0) -> Tuple[Optional['Tag'], int]:
+        """从字节串的指定偏移值处读取出Tag，按下标直接访问字节，无需包装为流逐字节读取
+
+        :param buffer: 输入的字节串
+        :param offset: 标签Tag域的偏移值
+        :return: (Tag, 标签之后的偏移值)，已到达字节串末尾时为(None, offset)
+        """
+        buffer_len = len(buffer)
+        if offset >= buffer_len:  # EOF of data
+            return None, offset
+
+        end = offset + 1
+        if buffer[offset] & 0x1f == 0x1f:  # High tag number form，后续字节b8为0时结束
+            # 至多扫描上限加1个后续字节，超出上限时由Tag构造时报错，再一次切片取出标签字节
+            scan_end = min(buffer_len, end + _MAX_TAG_NUMBER_OCTETS + 1)
+            while end < scan_end:
+                end += 1
+                if buffer[end - 1] & 0x80 == 0:
+                    break
+
+        return Tag._intern(bytes(buffer[offset:end])), end
+
+    @staticmethod
+    def _intern(octets: bytes) -> 'Tag':
+        """取得字节串对应的共享Tag对象，缓存未命中时构造并检查标签"""
+        tag = _TAG_CACHE.get(octets)
+        if tag is None:
+            tag = Tag(octets)
+            if len(_TAG_CACHE) < _TAG_CACHE_SIZE:
+                _TAG_CACHE[octets] = tag
+        return tag
 
 
 class Length:
@@ -261,7 +309,7 @@ class Length:
         :param data:输入的字节串或流
         """
         if isinstance(data, bytes) or isinstance(data, bytearray):
-            data = BytesIO(data)
+            return Length.decode_from(data, 0, der)[0]
         leading = data.read(1)
         if len(leading) == 0:
             return None
@@ -272,14 +320,48 @@ class Length:
         elif initial & 0x80 == 0:  # 短格式
             return Length(leading)
         else:  # 长格式
-            buffer = bytearray(leading)
-            subsequent_len = initial & 0x7f
+            subsequent_len = Length._check_subsequent_len(initial)
             subsequent_octets = data.read(subsequent_len)
             if len(subsequent_octets) < subsequent_len:
                 raise InvalidEncoding("剩余字节数{0:d}不足长度{1:d}/Insufficient octets {0:d} < {1:d}"
                                       .format(len(subsequent_octets), subsequent_len))
-            buffer.extend(subsequent_octets)
-            return Length(bytes(buffer), der)
+            return Length(leading + subsequent_octets, der)
+
+    @staticmethod
+    def decode_from(buffer: Union[bytes, bytearray, memoryview], offset: int = 0, der: bool = False
+                    ) -> Tuple[Optional['Length'], int]:
+        """从字节串的指定偏移值处读取出Length，按下标直接访问字节，无需包装为流逐字节读取
+
+        :param buffer: 输入的字节串
+        :param offset: 长度Length域的偏移值
+        :param der: 是否按DER规范检查
+        :return: (Length, 长度之后的偏移值)，已到达字节串末尾时为(None, offset)
+        """
+        buffer_len = len(buffer)
+        if offset >= buffer_len:
+            return None, offset
+
+        initial = buffer[offset]
+        end = offset + 1
+        if initial == 0x80 or initial & 0x80 == 0:  # 不确定长度格式或短格式
+            return Length(bytes(buffer[offset:end])), end
+
+        # 长格式
+        subsequent_len = Length._check_subsequent_len(initial)
+        if end + subsequent_len > buffer_len:
+            raise InvalidEncoding("剩余字节数{0:d}不足长度{1:d}/Insufficient octets {0:d} < {1:d}"
+                                  .format(buffer_len - end, subsequent_len))
+        end += subsequent_len
+        return Length(bytes(buffer[offset:end]), der), end
+
+    @staticmethod
+    def _check_subsequent_len(initial: int) -> int:
+        """取得长格式首字节表示的后续字节数，在读取后续字节之前拒绝超出上限的长度"""
+        subsequent_len = initial & 0x7f
+        if subsequent_len > _MAX_LENGTH_OCTETS:
+            raise InvalidEncoding("长格式后续字节数{0:d}超过{1:d}/Subsequent length octets {0:d} over {1:d}"
+                                  .format(subsequent_len, _MAX_LENGTH_OCTETS))
+        return subsequent_len
 
     def __repr__(self):
         if self.is_definite:
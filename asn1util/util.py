@@ -20,17 +20,8 @@ def signed_int_to_bytes(value: int):
     :param value: 整数
     :return: 表示整数的字节
     """
-    if value == 0:
-        return b'\x00'
-    elif value > 0:
-        min_byte_len = value.bit_length() // 8 + 1
-    else:
-        abs_bit_len = (-value).bit_length()
-        min_byte_len = abs_bit_len // 8 + 1
-        # 处理负整数补码的边界值问题，即长度为k字节时可以表示的最小负整数为-2**(8k-1)，比相应的正整数多1个
-        if abs_bit_len % 8 == 0 and (0x01 << (abs_bit_len - 1)) + value == 0:
-            min_byte_len -= 1
-
+    # 负数按其反码~value计算位长，即自然处理了补码的边界值问题（长度为k字节时可以表示的最小负整数为-2**(8k-1)）
+    min_byte_len = (~value if value < 0 else value).bit_length() // 8 + 1
     return value.to_bytes(min_byte_len, byteorder='big', signed=True)
 
 
@@ -35,6 +35,15 @@ class UniversalClassTypes(TestCase):
         self.assertEqual(oid, r_oid)
         r_oid = ASN1ObjectIdentifier(value=oid.oid_string)
         self.assertEqual(oid, r_oid)
+        self.assertEqual(hash(oid), hash(r_oid))
+        self.assertFalse(hasattr(oid, '__dict__'))
+        leading_zero = ASN1ObjectIdentifier('1.2.0840')
+        self.assertEqual((1, 2, 840), leading_zero.value)
+        self.assertEqual('1.2.840', leading_zero.oid_string)
+        for invalid in ('1.2.3abc', '1.2.3\n', '1.+2.3'):
+            self.assertIsNone(ASN1ObjectIdentifier.STRING_PATTERN.match(invalid))
+            with self.assertRaises(ValueError):
+                ASN1ObjectIdentifier(invalid)
 
     def test_universal(self):
         a = ASN1Integer(1234567890)
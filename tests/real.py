@@ -1,5 +1,6 @@
 import logging
 import random
+import struct
 from decimal import *
 from unittest import TestCase
 
@@ -41,6 +42,12 @@ class RealValueTestCase(TestCase):
         constructed = to_ieee758_double(s, n, e)
         print(constructed)
 
+        for base in (2, 8, 16):
+            for iv in (12, -1000, 2 ** 40 + 2 ** 20):
+                rv = ASN1Real(value=iv, base=base)
+                self.assertEqual(base, ASN1Real(value_octets=rv.value_octets)._base)
+                self.assertEqual(iv, ASN1Real(value_octets=rv.value_octets).value)
+
     def test_specials(self):
         # 特殊数测试
         for fv in (-0.0, float('inf'), float('-inf')):
@@ -56,6 +63,51 @@ class RealValueTestCase(TestCase):
         print(float('nan'), ASN1Real(value=float('nan'), base=10))
         print(Decimal('NaN'), ASN1Real(value=Decimal('NaN')))
 
+    def test_zero(self):
+        for zv, base in ((0, 2), (0.0, 2), (0, 10), (Decimal(0), 10)):
+            rv = ASN1Real(value=zv, base=base)
+            self.assertEqual(b'', rv.value_octets)
+            self.assertEqual(0.0, ASN1Real(value_octets=rv.value_octets).value)
+        self.assertEqual((0, 0, 0), int_to_base2_sne(0))
+        self.assertIn('base=2', repr(ASN1Real(0)))
+        self.assertIn('base=10', repr(ASN1Real(Decimal(0))))
+        with self.assertRaises(ValueError):
+            to_binary_encoding(0, 0, -64)
+
+    def test_int_base10(self):
+        for iv in (7, -1500, 10 ** 30, 123456789012345678901234567890):
+            rv = ASN1Real(value=iv, base=10)
+            self.assertEqual(0x03, rv.value_octets[0])
+            self.assertEqual(iv, ASN1Real(value_octets=rv.value_octets).value)
+        for v in (15, 15.0, Decimal('15'), Decimal('15.00')):
+            self.assertEqual(b'\x0315.E+0', to_decimal_encoding(v))
+
+    def test_truncated(self):
+        for octets in (b'\x80', b'\x81\x01', b'\x82\x00', b'\x83', b'\x83\x03\x00'):
+            self.assertRaises(InvalidEncoding, ASN1Real, value_octets=octets)
+
+    def test_decimal_base2(self):
+        for dv, sne in (('0.5', (0, 1, -1)), ('3.25', (0, 13, -2)), ('-12.125', (1, 97, -3)), ('1e3', (0, 125, 3))):
+            self.assertEqual(sne, decimal_to_base2_sne(Decimal(dv)))
+        s, n, e = decimal_to_base2_sne(Decimal('1e-20'))
+        self.assertEqual(0, s)
+        self.assertTrue(0 < n < 2 ** 64)
+        self.assertAlmostEqual(1.0, n * 2.0 ** e / 1e-20, places=15)
+        rv = ASN1Real(Decimal('1e-20'), base=2)
+        self.assertAlmostEqual(1e-20, ASN1Real(value_octets=rv.value_octets).value, delta=1e-35)
+
+    def test_float_batch(self):
+        values = [random.uniform(-1e6, 1e6) for _ in range(100)]
+        values.extend((0.0, -0.0, float('inf'), float('-inf'), float('nan'), 5e-324, 0.5))
+        for base in (2, 8, 16):
+            encodings = floats_to_binary_encodings(values, base)
+            self.assertEqual([ASN1Real(value=v, base=base).value_octets for v in values], encodings)
+            for v, octets in zip(values[:100], encodings):
+                self.assertEqual((*float_to_base2_sne(v), base), from_binary_encoding(octets))
+
+        packed = struct.pack('>{}d'.format(len(values)), *values)
+        self.assertEqual([float_to_base2_sne(v) for v in values], ieee754_doubles_to_base2_sne(packed))
+
     def test_real(self):
         for _ in range(1000):
             fv = random.randint(-1, 1) * random.randint(0, 10000) / random.randint(1, 10000)
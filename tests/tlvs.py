@@ -73,6 +73,43 @@ class TLVTestCase(TestCase):
         self.assertIsNone(l)
         self.assertIsNone(v)
 
+    def test_stream_decoder_buffer(self):
+        data = bytes.fromhex('30 80 1f 81 00 02 01 02 04 82 00 03 31 32 33 00 00 02 01 ff')
+        tokens = [(t.tag.octets, t.length.octets, t.offsets, t.value) for t in StreamDecoder(data)]
+        self.assertEqual(tokens, [(t.tag.octets, t.length.octets, t.offsets, t.value)
+                                  for t in StreamDecoder(BytesIO(data))])
+        self.assertEqual((b'\x1f\x81\x00', b'\x02', (2, 5, 6), b'\x01\x02'), tokens[1])
+        self.assertEqual((Tag(b'\x04'), 9), Tag.decode_from(data, 8))
+        self.assertEqual((None, len(data)), Tag.decode_from(data, len(data)))
+        self.assertIs(Tag.decode(data), Tag.decode(BytesIO(data)))
+        self.assertEqual(3, Length.decode_from(data, 9)[0].value)
+        with self.assertRaises(InvalidEncoding):
+            Length.decode_from(data[:11], 9)
+
+        buffer = bytearray(data)
+        decoder = StreamDecoder(buffer)
+        buffer.append(0x00)  # 解码器不应锁定调用方的bytearray
+        self.assertEqual(tokens, [(t.tag.octets, t.length.octets, t.offsets, t.value) for t in decoder])
+
+    def test_long_form_limits(self):
+        self.assertEqual(64, Tag(b'\x9f\x40').number)
+        self.assertEqual(0x3fff, Tag.decode(b'\x9f\xff\x7f\x00').number)
+        with self.assertRaises(InvalidEncoding):
+            Tag.decode(b'\x9f' + b'\x81' * 1000)
+        with self.assertRaises(InvalidEncoding):
+            Tag.decode(BytesIO(b'\x9f' + b'\x81' * 1000))
+        self.assertEqual(2 ** 64 - 1, Length.decode(b'\x88' + b'\xff' * 8).value)
+        with self.assertRaises(InvalidEncoding):
+            Length.decode(b'\x89' + b'\x00' * 9)
+
+    def test_encoder_reals(self):
+        values = [1.5, -0.0, float('inf'), 0.0, 1.23456789e-300]
+        batch, single = StreamEncoder(), StreamEncoder()
+        batch.append_reals(values)
+        for value in values:
+            single.append_real(value)
+        self.assertEqual(single.data, batch.data)
+
     def test_encoder(self):
         encoder = StreamEncoder()
         with encoder.within_sequence():